@@ -0,0 +1,204 @@
+import csv
+import json
+import os
+import re
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+DAY_ORDER = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6}
+EXPORT_FORMATS = {"csv", "json", "ics"}
+CSV_HEADER = ["entity_id", "day", "timeslot", "course_code", "prof_id", "room_id"]
+
+
+def timeslot_sort_key(timeslot):
+    """
+    Sort key for timeslots like 'Mon_10AM': by weekday, then by clock hour.
+    """
+    day, _, hour = timeslot.partition('_')
+    return (DAY_ORDER.get(day, 99), _timeslot_hour(hour) if hour else 99, timeslot)
+
+
+def _timeslot_hour(hour_str):
+    match = re.match(r'(\d{1,2})(AM|PM)$', hour_str.strip().upper())
+    if not match:
+        return 99
+    hour = int(match.group(1)) % 12
+    return hour + 12 if match.group(2) == 'PM' else hour
+
+
+def build_export_views(master, program_courses, prof_ids=(), room_ids=()):
+    """
+    Buckets the master timetable into professor, room and program views in a
+    single pass. The master list is sorted once, so every bucket comes out
+    already in timeslot order and never needs re-sorting.
+
+    Every program, professor and room passed in gets a bucket, even with no
+    sessions, so idle entities still appear in the exports.
+    """
+    sessions = sorted(
+        (tuple(s) for s in master if isinstance(s, (list, tuple)) and len(s) >= 4),
+        key=lambda s: timeslot_sort_key(s[3])
+    )
+
+    # Invert program -> courses once, so each session is routed in O(1)
+    course_programs = {}
+    for prog_id, course_codes in program_courses.items():
+        for code in course_codes:
+            course_programs.setdefault(code, []).append(prog_id)
+
+    views = {
+        "master": {"all": sessions},
+        "professor": {prof_id: [] for prof_id in prof_ids},
+        "room": {room_id: [] for room_id in room_ids},
+        "program": {prog_id: [] for prog_id in program_courses},
+    }
+    for session in sessions:
+        course_code, prof_id, room_id, _ = session[:4]
+        views["professor"].setdefault(prof_id, []).append(session)
+        views["room"].setdefault(room_id, []).append(session)
+        for prog_id in course_programs.get(course_code, []):
+            views["program"][prog_id].append(session)
+    return views
+
+
+def _write_csv(path, entities):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        for entity_id, schedule in entities.items():
+            writer.writerows(
+                (entity_id, s[3].split('_')[0], s[3], s[0], s[1], s[2]) for s in schedule
+            )
+
+
+def _write_json(path, views):
+    # Streamed one entity at a time instead of building one big string
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for i, (kind, entities) in enumerate(views.items()):
+            f.write(',' if i else '')
+            f.write(f'\n  {json.dumps(kind)}: {{')
+            for j, (entity_id, schedule) in enumerate(entities.items()):
+                f.write(',' if j else '')
+                rows = [
+                    {"timeslot": s[3], "course_code": s[0], "prof_id": s[1], "room_id": s[2]}
+                    for s in schedule
+                ]
+                f.write(f'\n    {json.dumps(str(entity_id))}: {json.dumps(rows)}')
+            f.write('\n  }')
+        f.write('\n}\n')
+
+
+def _ics_escape(text):
+    return (str(text).replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\n', '\\n'))
+
+
+def _safe_filename(entity_id):
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', str(entity_id)) or '_'
+
+
+def _write_ics(path, kind, entity_id, schedule, term_start, stamp):
+    """
+    Writes one weekly-recurring iCalendar file. Each timeslot is a one-hour
+    event anchored in the week of term_start (a Monday).
+    """
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//TimeTableGen//Timetable Export//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_ics_escape(f'{kind} {entity_id}')}",
+    ]
+    for course_code, prof_id, room_id, timeslot in (s[:4] for s in schedule):
+        day, _, hour_str = timeslot.partition('_')
+        hour = _timeslot_hour(hour_str)
+        if day not in DAY_ORDER or hour == 99:
+            continue
+        start = datetime.datetime.combine(
+            term_start + datetime.timedelta(days=DAY_ORDER[day] - 1), datetime.time(hour)
+        )
+        end = start + datetime.timedelta(hours=1)
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{_ics_escape(f'{course_code}-{timeslot}-{room_id}')}@timetablegen",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{start:%Y%m%dT%H%M%S}",
+            f"DTEND:{end:%Y%m%dT%H%M%S}",
+            "RRULE:FREQ=WEEKLY",
+            f"SUMMARY:{_ics_escape(course_code)}",
+            f"LOCATION:{_ics_escape(room_id)}",
+            f"DESCRIPTION:{_ics_escape(f'{course_code} by {prof_id} in {room_id}')}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        f.write('\r\n'.join(lines) + '\r\n')
+
+
+def export_timetables(views, out_dir="timetables", formats=("csv", "json", "ics"),
+                      workers=4, term_start=None):
+    """
+    Writes the master, professor, room and program timetables to out_dir.
+
+    views is the mapping returned by build_export_views. CSV gives one file
+    per view, JSON one file with every view, and ICS one calendar per entity.
+    Per-entity ICS files are written in parallel across `workers` threads.
+    Returns the list of paths written.
+    """
+    if isinstance(formats, str):
+        formats = formats.split(',')
+    formats = {f.strip().lower() for f in formats if f.strip()}
+    unknown = formats - EXPORT_FORMATS
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(sorted(unknown))}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+
+    if "csv" in formats:
+        for kind, entities in views.items():
+            path = os.path.join(out_dir, f"{kind}_timetable.csv")
+            _write_csv(path, entities)
+            written.append(path)
+
+    if "json" in formats:
+        path = os.path.join(out_dir, "timetables.json")
+        _write_json(path, views)
+        written.append(path)
+
+    if "ics" in formats:
+        if term_start is None:
+            today = datetime.date.today()
+            term_start = today - datetime.timedelta(days=today.weekday())
+        stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+        jobs = []
+        for kind, entities in views.items():
+            kind_dir = os.path.join(out_dir, "ics", kind)
+            os.makedirs(kind_dir, exist_ok=True)
+            # Sanitising can map distinct IDs ('Lab 1', 'Lab/1') to one name;
+            # suffix repeats so every entity gets its own file. Compared
+            # case-insensitively for case-insensitive filesystems.
+            used_names = set()
+            for entity_id, schedule in entities.items():
+                base = _safe_filename(entity_id)
+                name, n = base, 1
+                while name.lower() in used_names:
+                    n += 1
+                    name = f"{base}_{n}"
+                used_names.add(name.lower())
+                path = os.path.join(kind_dir, f"{name}.ics")
+                jobs.append((path, kind, entity_id, schedule))
+
+        if workers and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_write_ics, *job, term_start, stamp) for job in jobs]
+                for future in futures:
+                    future.result()
+        else:
+            for job in jobs:
+                _write_ics(*job, term_start, stamp)
+        written.extend(job[0] for job in jobs)
+
+    return written
@@ -4,7 +4,7 @@ from collections import deque
 USE_TABU_SEARCH_POLISH=True
 
 
-def solve_with_ga(university_data, student_groups, seed_solution=None):
+def solve_with_ga(university_data, student_groups, seed_solution=None, verbose=True):
     
     # --- 1. Unpack Data from university_data ---
     scheduled_courses = university_data['scheduled_courses']
@@ -213,12 +213,12 @@ def solve_with_ga(university_data, student_groups, seed_solution=None):
         final_solution = best_individual
 
     # --- 7. Final Analysis ---
-    print("\n--- Final Best Timetable Found ---")
-    
-    print("\n--- Best Timetable Found (GA) ---")
     best_individual.sort(key=lambda session: TIMESLOT_MAP.get(session[3], 99))
-    for session in best_individual:
-        print(f"  {session[3]}: {session[0]} with {session[1]} in {session[2]}")
+    if verbose:
+        print("\n--- Final Best Timetable Found ---")
+        print("\n--- Best Timetable Found (GA) ---")
+        for session in best_individual:
+            print(f"  {session[3]}: {session[0]} with {session[1]} in {session[2]}")
     
     final_score = best_individual.fitness.values[0]
     print(f"\nFinal Fitness Score: {final_score}")
@@ -5,17 +5,17 @@ from data_loader import load_university_data
 from analyzer import run_student_clustering
 from ga_solver import solve_with_ga
 from sat_solver import solve_with_or_tools
+from exporter import EXPORT_FORMATS, build_export_views, export_timetables
 
 def print_formatted_schedule(schedule_list):
     if not schedule_list:
         print("  - No classes scheduled.")
         return
-        
-    day_order = {"Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6}
-    # tolerant sort: session is (course_code, prof_id, room_id, timeslot)
-    sorted_schedule = sorted(schedule_list, key=lambda s: (day_order.get(s[3].split('_')[0], 99), s[3]))
+
+    # schedule_list comes from build_export_views, already in timeslot order;
+    # session is (course_code, prof_id, room_id, timeslot)
     last_day = ""
-    for session in sorted_schedule:
+    for session in schedule_list:
         course_code, prof_id, room_id, timeslot = session
         day = timeslot.split('_')[0]
         if day != last_day:
@@ -27,8 +27,24 @@ def main():
     parser = argparse.ArgumentParser(description="AI-Based Timetable Generation System")
     parser.add_argument('--solver', required=True, choices=['ga', 'sat', 'hybrid'], 
                         help="Specify the solver to use: 'ga', 'sat', or 'hybrid'.")
+    parser.add_argument('--export-dir', default=None,
+                        help="Write master, professor, room and program timetables to this directory.")
+    parser.add_argument('--formats', default='csv,json,ics',
+                        help="Comma-separated export formats: csv, json, ics.")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Threads used to write per-entity iCalendar files.")
+    parser.add_argument('--quiet', action='store_true',
+                        help="Skip printing sessions and timetables to the console.")
     args = parser.parse_args()
 
+    formats = {f.strip().lower() for f in args.formats.split(',') if f.strip()}
+    unknown_formats = formats - EXPORT_FORMATS
+    if unknown_formats:
+        parser.error(f"unknown export format(s): {', '.join(sorted(unknown_formats))} "
+                     f"(choose from {', '.join(sorted(EXPORT_FORMATS))})")
+    if args.export_dir and not formats:
+        parser.error("--formats must name at least one of: " + ', '.join(sorted(EXPORT_FORMATS)))
+
     print("--- Loading University Data from CSV files ---")
     result = load_university_data()
     # Expecting tuple (university_data, kmeans_needed, programs_df)
@@ -58,15 +74,16 @@ def main():
 
     start_time = time.time()
     if args.solver == 'ga':
-        solution_package = solve_with_ga(university_data, dynamic_groups) 
+        solution_package = solve_with_ga(university_data, dynamic_groups, verbose=not args.quiet)
     elif args.solver == 'sat':
-        solution_package = solve_with_or_tools(university_data, dynamic_groups, time_limit=30)
+        solution_package = solve_with_or_tools(university_data, dynamic_groups, time_limit=30, verbose=not args.quiet)
     elif args.solver == "hybrid":
-        seed_pkg = solve_with_or_tools(university_data, dynamic_groups, time_limit=20)
+        seed_pkg = solve_with_or_tools(university_data, dynamic_groups, time_limit=20, verbose=not args.quiet)
         seed_solution = None
         if seed_pkg and isinstance(seed_pkg, dict):
             seed_solution = seed_pkg.get("master_timetable")
-        solution_package = solve_with_ga(university_data, dynamic_groups, seed_solution=seed_solution)
+        solution_package = solve_with_ga(university_data, dynamic_groups, seed_solution=seed_solution,
+                                         verbose=not args.quiet)
 
     end_time = time.time()
     print(f"\n--- Solver finished in {end_time - start_time:.2f} seconds ---")
@@ -84,28 +101,39 @@ def main():
         except Exception:
             master = []
 
-    session_map = {s[0]: s for s in master if isinstance(s, (list, tuple)) and len(s) >= 4}
+    # programs_df may be a dataframe; fallback to dynamic_groups if None
+    if programs_df is not None:
+        program_courses = {
+            row.get('program_id'): str(row.get('course_codes', '')).split(',')
+            for row in programs_df.to_dict('records')
+        }
+    else:
+        program_courses = dict(dynamic_groups)
+
+    # One set of views feeds both the files and the console, so they always agree
+    views = build_export_views(master, program_courses,
+                               prof_ids=university_data.get("faculty", {}).keys(),
+                               room_ids=university_data.get("rooms", {}).keys())
+
+    if args.export_dir:
+        export_start = time.time()
+        written = export_timetables(views, out_dir=args.export_dir,
+                                    formats=formats, workers=args.workers)
+        print(f"\n--- Exported {len(written)} files to {args.export_dir} "
+              f"in {time.time() - export_start:.2f} seconds ---")
+
+    if args.quiet:
+        return
 
     print("\n\n--- Professor Timetables ---")
-    for prof, schedule in solution_package.get("professor_timetables", {}).items():
+    for prof, schedule in views["professor"].items():
         print(f"\nSchedule for {prof}:")
         print_formatted_schedule(schedule)
 
     print("\n\n--- Program Timetables  ---")
-    # programs_df may be a dataframe; fallback to dynamic_groups if None
-    if programs_df is not None:
-        for index, row in programs_df.iterrows():
-            program_id = row.get('program_id')
-            course_codes = str(row.get('course_codes', '')).split(',')
-            print(f"\nSchedule for {program_id}:")
-            schedule_for_program = [session_map[c] for c in course_codes if c in session_map]
-            print_formatted_schedule(schedule_for_program)
-    else:
-        # fallback: iterate dynamic_groups if programs_df absent
-        for prog_id, required_subjects in dynamic_groups.items():
-            print(f"\nSchedule for {prog_id}:")
-            schedule_for_program = [session_map[c] for c in required_subjects if c in session_map]
-            print_formatted_schedule(schedule_for_program)
+    for program_id, schedule in views["program"].items():
+        print(f"\nSchedule for {program_id}:")
+        print_formatted_schedule(schedule)
 
 if __name__ == '__main__':
     main()
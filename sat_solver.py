@@ -1,6 +1,6 @@
 from ortools.sat.python import cp_model
 
-def solve_with_or_tools(university_data, student_groups, time_limit=10):
+def solve_with_or_tools(university_data, student_groups, time_limit=10, verbose=True):
     
     # --- 1. Unpack Data ---
     all_courses = university_data['all_courses']
@@ -86,7 +86,8 @@ def solve_with_or_tools(university_data, student_groups, time_limit=10):
         # FIX: Iterate over sessions.items() for safety
         for (c, p, r, t), session_var in sessions.items():
             if solver.Value(session_var) == 1:
-                print(f'  {t}: {c} with {p} in {r}')
+                if verbose:
+                    print(f'  {t}: {c} with {p} in {r}')
                 solution.append((c, p, r, t))
         prof_timetables = {prof_id: [] for prof_id in university_data['faculty'].keys()}
         prog_timetables = {group_id: [] for group_id in student_groups.keys()}